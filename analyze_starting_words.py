@@ -4,86 +4,107 @@ Analyze all starting words for Wordle to find optimal choices for both normal an
 """
 
 import math
-from collections import Counter
-from wordle_solver import WordleSolver, Colors
+import sys
 
-def analyze_starting_word(solver, word):
-    """Analyze the information gain of a starting word."""
-    if word not in solver.words:
-        return None
-    
-    information_gain = solver._calculate_information_gain(word, solver.words)
-    
-    # Analyze letter distribution
-    letter_counts = Counter(word)
-    vowels = sum(1 for c in word if c in 'AEIOU')
-    consonants = 5 - vowels
-    
-    # Calculate letter frequency score (how common the letters are)
-    letter_frequency = {
-        'E': 12.0, 'T': 9.1, 'A': 8.2, 'O': 7.5, 'I': 7.0, 'N': 6.7, 'S': 6.3, 'H': 6.1,
-        'R': 6.0, 'D': 4.3, 'L': 4.0, 'C': 2.8, 'U': 2.8, 'M': 2.4, 'W': 2.4, 'F': 2.2,
-        'G': 2.0, 'Y': 2.0, 'P': 1.9, 'B': 1.5, 'V': 0.98, 'K': 0.77, 'J': 0.15, 'X': 0.15,
-        'Q': 0.10, 'Z': 0.07
-    }
-    
-    frequency_score = sum(letter_frequency.get(c, 0) for c in word)
+import numpy as np
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+from wordle_solver import (WordleSolver, Colors, encode_feedback, feedback_histogram,
+                           feedback_entropy, save_starting_cache)
+
+# Number of top words per ranking considered for the balanced recommendations
+TOP_CANDIDATES = 50
+
+# Vowels as letter codes (A=0) for vectorized lookups
+VOWEL_CODES = np.array([ord(c) - ord('A') for c in 'AEIOU'], dtype=np.uint8)
+
+# Feedback scenarios used to score words for hard mode, encoded once
+HARD_MODE_SCENARIOS = [
+    ("XXXXX", "All gray"),
+    ("XXYXX", "One yellow in middle"),
+    ("GXXXX", "One green at start"),
+    ("XXGXX", "One green in middle"),
+    ("YXXXX", "One yellow at start"),
+    ("GGXXX", "Two greens at start"),
+    ("XXGGX", "Two greens in middle"),
+    ("GXGXX", "Two greens separated"),
+]
+HARD_MODE_SCENARIO_CODES = np.array([encode_feedback(feedback) for feedback, _ in HARD_MODE_SCENARIOS])
+
+def analyze_letters(word_array):
+    """Count the vowels of all words at once."""
+    return np.isin(word_array, VOWEL_CODES).sum(axis=1)
+
+def analyze_starting_word(word, feedback_counts, return_distribution=False):
+    """Analyze the information gain of a starting word.
     
-    # Analyze feedback distribution
-    feedback_counts = Counter()
-    for solution in solver.words:
-        feedback = solver._get_feedback(word, solution)
-        feedback_str = ''.join(feedback)
-        feedback_counts[feedback_str] += 1
+    feedback_counts is the histogram of the word's feedback codes against
+    every solution. It is only kept in the result when return_distribution
+    is set, since retaining it for every word dominates the analyzer's
+    memory. Vowel counts are added separately for all words at once by
+    analyze_letters.
+    """
+    information_gain = feedback_entropy(feedback_counts)
     
     # Calculate how well the word splits the solution space
-    max_group_size = max(feedback_counts.values()) if feedback_counts else 0
-    split_efficiency = 1 - (max_group_size / len(solver.words))
+    max_group_size = int(feedback_counts.max())
+    split_efficiency = 1 - (max_group_size / int(feedback_counts.sum()))
     
-    return {
+    analysis = {
         'word': word,
         'information_gain': information_gain,
-        'vowels': vowels,
-        'consonants': consonants,
-        'frequency_score': frequency_score,
         'split_efficiency': split_efficiency,
-        'feedback_distribution': feedback_counts
+        'max_group_size': max_group_size
     }
+    if return_distribution:
+        analysis['feedback_distribution'] = feedback_counts
+    return analysis
 
-def analyze_hard_mode_performance(solver, word, analysis_data):
-    """Analyze how well a word performs in hard mode scenarios."""
-    hard_mode_scores = []
-    
-    # Test various feedback scenarios
-    test_scenarios = [
-        ("XXXXX", "All gray"),
-        ("XXYXX", "One yellow in middle"),
-        ("GXXXX", "One green at start"),
-        ("XXGXX", "One green in middle"),
-        ("YXXXX", "One yellow at start"),
-        ("GGXXX", "Two greens at start"),
-        ("XXGGX", "Two greens in middle"),
-        ("GXGXX", "Two greens separated"),
-    ]
-    
-    for feedback_str, description in test_scenarios:
-        feedback = list(feedback_str)
-        
-        # Create a temporary solver to test this scenario
-        temp_solver = WordleSolver(hard_mode=True)
-        temp_solver.guess_history.append((word, feedback))
-        
-        # Count how many valid hard mode guesses remain
-        valid_guesses = [w for w in temp_solver.words if temp_solver._is_hard_mode_compatible(w)]
-        
-        # Score this scenario (fewer remaining guesses is better for hard mode)
-        scenario_score = len(valid_guesses)
-        hard_mode_scores.append(scenario_score)
+def analyze_hard_mode_performance(feedback_counts, analysis_data):
+    """Analyze how well a word performs in hard mode scenarios.
+    
+    A candidate stays a valid hard mode guess after a scenario exactly when
+    the word would have produced that feedback against it, so each
+    scenario's score is the histogram bin of its feedback code.
+    """
+    # Score each scenario (fewer remaining guesses is better for hard mode)
+    hard_mode_scores = feedback_counts[HARD_MODE_SCENARIO_CODES]
     
     # Calculate average hard mode performance
-    avg_hard_mode_score = sum(hard_mode_scores) / len(hard_mode_scores)
-    analysis_data['hard_mode_score'] = avg_hard_mode_score
-    analysis_data['hard_mode_scenarios'] = hard_mode_scores
+    analysis_data['hard_mode_score'] = float(hard_mode_scores.mean())
+    analysis_data['hard_mode_scenarios'] = hard_mode_scores.tolist()
+
+def top_indices(scores, k):
+    """Indices of the k lowest scores, lowest first, with ties in word-list order.
+    
+    np.partition finds the k-th score without a full sort; only the
+    entries at or below it are then sorted.
+    """
+    k = min(k, len(scores))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    
+    threshold = np.partition(scores, k - 1)[k - 1]
+    candidates = np.flatnonzero(scores <= threshold)
+    order = np.argsort(scores[candidates], kind='stable')
+    return candidates[order][:k]
+
+def track_progress(results, total):
+    """Yield results while reporting progress."""
+    if tqdm is not None:
+        yield from tqdm(results, total=total, desc="Analyzing", unit="word")
+        return
+    
+    progress_interval = max(1, total // 20)  # Show progress every 5%
+    for done, result in enumerate(results):
+        if done % progress_interval == 0:
+            sys.stdout.write(f"{Colors.CYAN}Progress: {done / total * 100:.1f}% ({done}/{total}){Colors.END}\n")
+            sys.stdout.flush()
+        yield result
 
 def main():
     solver = WordleSolver()
@@ -94,43 +115,55 @@ def main():
     print(f"{Colors.WHITE}Analyzing all words for optimal starting choices...{Colors.END}")
     print()
     
+    # Feedback of every word against every solution, computed once up front
+    print(f"{Colors.YELLOW}⏳ Precomputing feedback matrix...{Colors.END}")
+    feedback_matrix = solver.feedback_matrix
+    
     # Analyze all words (this will take some time)
     print(f"{Colors.YELLOW}⏳ Analyzing all {len(solver.words)} words...{Colors.END}")
     
-    all_results = []
-    progress_interval = max(1, len(solver.words) // 20)  # Show progress every 5%
+    n_words = len(solver.words)
+    words = solver.words
     
-    for i, word in enumerate(solver.words):
-        if i % progress_interval == 0:
-            progress = (i / len(solver.words)) * 100
-            print(f"{Colors.CYAN}Progress: {progress:.1f}% ({i}/{len(solver.words)}){Colors.END}")
-        
-        analysis = analyze_starting_word(solver, word)
-        if analysis:
-            analyze_hard_mode_performance(solver, word, analysis)
-            all_results.append(analysis)
+    # Results are kept as parallel arrays indexed like the word list
+    information_gain = np.empty(n_words, dtype=np.float64)
+    split_efficiency = np.empty(n_words, dtype=np.float64)
+    hard_mode_score = np.empty(n_words, dtype=np.float64)
+    
+    # With the matrix in hand each word is one histogram, so a plain loop is
+    # faster than paying for worker processes
+    for i in track_progress(range(n_words), n_words):
+        feedback_counts = feedback_histogram(feedback_matrix[i])
+        analysis = analyze_starting_word(words[i], feedback_counts)
+        analyze_hard_mode_performance(feedback_counts, analysis)
+        information_gain[i] = analysis['information_gain']
+        split_efficiency[i] = analysis['split_efficiency']
+        hard_mode_score[i] = analysis['hard_mode_score']
+    
+    # Vowels of every word in one vectorized lookup
+    vowel_counts = analyze_letters(solver.word_array)
     
     print(f"{Colors.GREEN}✅ Analysis complete!{Colors.END}")
     print()
     
-    # Sort by different criteria
-    by_info_gain = sorted(all_results, key=lambda x: x['information_gain'], reverse=True)
-    by_hard_mode = sorted(all_results, key=lambda x: x['hard_mode_score'])
-    by_frequency = sorted(all_results, key=lambda x: x['frequency_score'], reverse=True)
-    by_split_efficiency = sorted(all_results, key=lambda x: x['split_efficiency'], reverse=True)
+    # Let the solver pick up any of these as a starting word without recomputing
+    save_starting_cache(words, dict(zip(words, information_gain.tolist())))
+    
+    # Rank by different criteria; only the top entries are ever displayed
+    by_info_gain = top_indices(-information_gain, TOP_CANDIDATES)
+    by_hard_mode = top_indices(hard_mode_score, TOP_CANDIDATES)
     
     # Display top results for normal mode
     print(f"{Colors.CYAN}{'='*60}{Colors.END}")
     print(f"{Colors.BOLD}{Colors.GREEN}📈 TOP 20 WORDS BY INFORMATION GAIN (Normal Mode){Colors.END}")
     print(f"{Colors.CYAN}{'='*60}{Colors.END}")
     
-    for i, result in enumerate(by_info_gain[:20], 1):
+    for i, index in enumerate(by_info_gain[:20], 1):
         medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i:2d}."
-        word = result['word']
-        info_gain = result['information_gain']
-        vowels = result['vowels']
-        consonants = result['consonants']
-        split_eff = result['split_efficiency']
+        word = words[index]
+        info_gain = information_gain[index]
+        vowels = vowel_counts[index]
+        split_eff = split_efficiency[index]
         
         print(f"{medal} {Colors.BOLD}{word}{Colors.END}: {Colors.BLUE}{info_gain:.3f}{Colors.END} bits")
         print(f"    {Colors.CYAN}Letters:{Colors.END} {', '.join(word)} | {Colors.CYAN}Vowels:{Colors.END} {vowels} | {Colors.CYAN}Split efficiency:{Colors.END} {split_eff:.3f}")
@@ -141,13 +174,13 @@ def main():
     print(f"{Colors.CYAN}{'='*60}{Colors.END}")
     print(f"{Colors.WHITE}Lower scores are better (fewer remaining guesses on average){Colors.END}")
     
-    for i, result in enumerate(by_hard_mode[:20], 1):
+    for i, index in enumerate(by_hard_mode[:20], 1):
         medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i:2d}."
-        word = result['word']
-        hard_mode_score = result['hard_mode_score']
-        info_gain = result['information_gain']
+        word = words[index]
+        hard_score = hard_mode_score[index]
+        info_gain = information_gain[index]
         
-        print(f"{medal} {Colors.BOLD}{word}{Colors.END}: {Colors.YELLOW}{hard_mode_score:.1f}{Colors.END} avg remaining guesses")
+        print(f"{medal} {Colors.BOLD}{word}{Colors.END}: {Colors.YELLOW}{hard_score:.1f}{Colors.END} avg remaining guesses")
         print(f"    {Colors.CYAN}Info gain:{Colors.END} {info_gain:.3f} bits | {Colors.CYAN}Letters:{Colors.END} {', '.join(word)}")
     
     # Display balanced recommendations
@@ -156,16 +189,12 @@ def main():
     print(f"{Colors.CYAN}{'='*60}{Colors.END}")
     
     # Find words that are good in both modes
-    top_info_words = set(result['word'] for result in by_info_gain[:50])
-    top_hard_words = set(result['word'] for result in by_hard_mode[:50])
-    balanced_words = top_info_words.intersection(top_hard_words)
+    balanced_indices = np.intersect1d(by_info_gain, by_hard_mode)
     
-    if balanced_words:
+    if len(balanced_indices):
         print(f"{Colors.GREEN}Words that perform well in both modes:{Colors.END}")
-        for word in sorted(balanced_words)[:10]:
-            info_result = next(r for r in by_info_gain if r['word'] == word)
-            hard_result = next(r for r in by_hard_mode if r['word'] == word)
-            print(f"  {Colors.BOLD}{word}{Colors.END}: {Colors.BLUE}{info_result['information_gain']:.3f}{Colors.END} bits, {Colors.YELLOW}{hard_result['hard_mode_score']:.1f}{Colors.END} avg remaining")
+        for index in sorted(balanced_indices, key=lambda i: words[i])[:10]:
+            print(f"  {Colors.BOLD}{words[index]}{Colors.END}: {Colors.BLUE}{information_gain[index]:.3f}{Colors.END} bits, {Colors.YELLOW}{hard_mode_score[index]:.1f}{Colors.END} avg remaining")
     
     # Final recommendations
     print(f"\n{Colors.CYAN}{'='*60}{Colors.END}")
@@ -176,15 +205,15 @@ def main():
     best_hard = by_hard_mode[0]
     
     print(f"{Colors.GREEN}For Normal Mode:{Colors.END}")
-    print(f"  {Colors.BOLD}{best_normal['word']}{Colors.END} - {Colors.BLUE}{best_normal['information_gain']:.3f}{Colors.END} bits of information")
-    print(f"  Letters: {', '.join(best_normal['word'])} | Vowels: {best_normal['vowels']}")
+    print(f"  {Colors.BOLD}{words[best_normal]}{Colors.END} - {Colors.BLUE}{information_gain[best_normal]:.3f}{Colors.END} bits of information")
+    print(f"  Letters: {', '.join(words[best_normal])} | Vowels: {vowel_counts[best_normal]}")
     
     print(f"\n{Colors.YELLOW}For Hard Mode:{Colors.END}")
-    print(f"  {Colors.BOLD}{best_hard['word']}{Colors.END} - {Colors.YELLOW}{best_hard['hard_mode_score']:.1f}{Colors.END} avg remaining guesses")
-    print(f"  Letters: {', '.join(best_hard['word'])} | Vowels: {best_hard['vowels']}")
+    print(f"  {Colors.BOLD}{words[best_hard]}{Colors.END} - {Colors.YELLOW}{hard_mode_score[best_hard]:.1f}{Colors.END} avg remaining guesses")
+    print(f"  Letters: {', '.join(words[best_hard])} | Vowels: {vowel_counts[best_hard]}")
     
-    if best_normal['word'] == best_hard['word']:
-        print(f"\n{Colors.GREEN}🎉 {best_normal['word']} is optimal for both modes!{Colors.END}")
+    if best_normal == best_hard:
+        print(f"\n{Colors.GREEN}🎉 {words[best_normal]} is optimal for both modes!{Colors.END}")
     else:
         print(f"\n{Colors.CYAN}💡 Consider using different words for different modes{Colors.END}")
 
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Compiled kernels for the Wordle Co-Solver
+
+The kernels are JIT-compiled with Numba when it is installed. Running
+
+    python kernels.py
+
+builds them ahead of time into a curdler_kernels extension next to this
+file. When that extension is importable it is used instead, so neither
+Numba nor its compile/load step is needed at runtime. The ahead-of-time
+build runs each kernel on a single thread.
+"""
+
+import math
+import os
+
+import numpy as np
+
+try:
+    import curdler_kernels
+except ImportError:
+    curdler_kernels = None
+
+# With the prebuilt extension, only a build needs Numba
+if curdler_kernels is None or __name__ == "__main__":
+    try:
+        from numba import njit, prange
+        JIT_AVAILABLE = True
+    except ImportError:
+        JIT_AVAILABLE = False
+else:
+    JIT_AVAILABLE = False
+
+if not JIT_AVAILABLE:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Whether compiled kernels are available, ahead-of-time or JIT
+KERNELS_AVAILABLE = JIT_AVAILABLE or curdler_kernels is not None
+
+# Feedback patterns are packed into a single base-3 integer (G=2, Y=1, X=0) with
+# the first letter as the most significant digit, giving codes 0..242.
+NUM_FEEDBACK_CODES = 3 ** 5
+
+@njit(cache=True)
+def _feedback_code(guess: np.ndarray, solution: np.ndarray, remaining: np.ndarray) -> int:
+    """Packed feedback of one guess against one solution, for use inside kernels.
+
+    remaining is a zeroed int8[26] scratch buffer and is zeroed again on return.
+    """
+    # First pass: count solution letters not matched by a green
+    for k in range(5):
+        if guess[k] != solution[k]:
+            remaining[solution[k]] += 1
+    
+    # Second pass: greens, then yellows left to right while letters remain
+    code = 0
+    for k in range(5):
+        if guess[k] == solution[k]:
+            code = code * 3 + 2
+        elif remaining[guess[k]] > 0:
+            remaining[guess[k]] -= 1
+            code = code * 3 + 1
+        else:
+            code = code * 3
+    
+    for k in range(5):
+        remaining[solution[k]] = 0
+    return code
+
+@njit(cache=True)
+def _counts_entropy(counts: np.ndarray, total: int) -> float:
+    """Shannon entropy in bits of a feedback histogram, for use inside kernels.
+
+    Uses log2(S) - sum(c * log2(c)) / S, so each count needs one log and no
+    division; counts of 0 and 1 contribute nothing.
+    """
+    if total == 0:
+        return 0.0
+    weighted = 0.0
+    for count in counts:
+        if count > 1:
+            weighted += count * math.log2(count)
+    return math.log2(total) - weighted / total
+
+@njit(parallel=True, cache=True)
+def feedback_matrix_kernel(guesses: np.ndarray, solutions: np.ndarray) -> np.ndarray:
+    """Kernel behind wordle_solver.compute_feedback_matrix."""
+    n_guesses = guesses.shape[0]
+    n_solutions = solutions.shape[0]
+    matrix = np.empty((n_guesses, n_solutions), dtype=np.uint8)
+    
+    for i in prange(n_guesses):
+        remaining = np.zeros(26, dtype=np.int8)
+        for j in range(n_solutions):
+            matrix[i, j] = _feedback_code(guesses[i], solutions[j], remaining)
+    
+    return matrix
+
+@njit(cache=True)
+def feedback_histogram_kernel(guess: np.ndarray, solutions: np.ndarray) -> np.ndarray:
+    """Feedback code histogram of a uint8[5] guess against uint8[N, 5] solutions."""
+    counts = np.zeros(NUM_FEEDBACK_CODES, dtype=np.int32)
+    remaining = np.zeros(26, dtype=np.int8)
+    for j in range(solutions.shape[0]):
+        counts[_feedback_code(guess, solutions[j], remaining)] += 1
+    return counts
+
+@njit(parallel=True, cache=True)
+def score_all_kernel(feedback_matrix: np.ndarray, candidate_indices: np.ndarray,
+                      solution_indices: np.ndarray, out: np.ndarray):
+    """Kernel behind wordle_solver.score_candidates; candidates are scored in parallel under the JIT."""
+    n_solutions = solution_indices.shape[0]
+    for i in prange(candidate_indices.shape[0]):
+        row = feedback_matrix[candidate_indices[i]]
+        
+        # A candidate giving every solution the same feedback gains nothing
+        first = row[solution_indices[0]] if n_solutions > 0 else 0
+        j = 1
+        while j < n_solutions and row[solution_indices[j]] == first:
+            j += 1
+        if j >= n_solutions:
+            out[i] = 0.0
+            continue
+        
+        counts = np.zeros(NUM_FEEDBACK_CODES, dtype=np.int32)
+        for j in range(n_solutions):
+            counts[row[solution_indices[j]]] += 1
+        out[i] = _counts_entropy(counts, n_solutions)
+
+@njit(parallel=True, cache=True)
+def score_inline_kernel(word_array: np.ndarray, candidate_indices: np.ndarray,
+                         solution_indices: np.ndarray, out: np.ndarray):
+    """Kernel behind wordle_solver.score_candidates_inline; candidates are scored in parallel under the JIT."""
+    n_solutions = solution_indices.shape[0]
+    for i in prange(candidate_indices.shape[0]):
+        guess = word_array[candidate_indices[i]]
+        counts = np.zeros(NUM_FEEDBACK_CODES, dtype=np.int32)
+        remaining = np.zeros(26, dtype=np.int8)
+        for j in range(n_solutions):
+            counts[_feedback_code(guess, word_array[solution_indices[j]], remaining)] += 1
+        out[i] = _counts_entropy(counts, n_solutions)
+
+# Signatures of the ahead-of-time exports; word and feedback arrays are uint8,
+# index arrays int32
+AOT_EXPORTS = {
+    'feedback_matrix': (feedback_matrix_kernel, 'u1[:, :](u1[:, :], u1[:, :])'),
+    'feedback_histogram': (feedback_histogram_kernel, 'i4[:](u1[:], u1[:, :])'),
+    'score_all': (score_all_kernel, 'void(u1[:, :], i4[:], i4[:], f8[:])'),
+    'score_inline': (score_inline_kernel, 'void(u1[:, :], i4[:], i4[:], f8[:])'),
+}
+
+if curdler_kernels is not None and not JIT_AVAILABLE:
+    feedback_matrix_kernel = curdler_kernels.feedback_matrix
+    feedback_histogram_kernel = curdler_kernels.feedback_histogram
+    score_all_kernel = curdler_kernels.score_all
+    score_inline_kernel = curdler_kernels.score_inline
+
+def build():
+    """Compile the kernels ahead of time into the curdler_kernels extension."""
+    from numba.pycc import CC
+    
+    cc = CC('curdler_kernels')
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    for name, (kernel, signature) in AOT_EXPORTS.items():
+        cc.export(name, signature)(kernel.py_func)
+    cc.compile()
+
+if __name__ == "__main__":
+    build()
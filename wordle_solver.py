@@ -8,8 +8,47 @@ at each step based on information theory principles.
 
 import math
 import argparse
-from typing import List, Dict, Tuple, Set
-from collections import Counter
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from typing import List, Dict, Optional, Tuple, Set
+
+import numpy as np
+
+from kernels import (KERNELS_AVAILABLE, NUM_FEEDBACK_CODES, feedback_matrix_kernel,
+                     feedback_histogram_kernel, score_all_kernel, score_inline_kernel)
+
+# Feedback patterns are packed into a single base-3 integer (G=2, Y=1, X=0) with
+# the first letter as the most significant digit, giving codes 0..242.
+GRAY, YELLOW, GREEN = 0, 1, 2
+FEEDBACK_MARKS = 'XYG'
+_FB_RE = re.compile(r'[GYXgyx]{5}')
+_WORD_RE = re.compile(r'[A-Z]{5}')
+_FB_DIGITS = str.maketrans('XYGxyg', '012012')  # Marks as base-3 digits
+ALL_GREEN = NUM_FEEDBACK_CODES - 1
+
+# Results that only depend on the word list are cached on disk under
+# $XDG_CACHE_HOME/curdler (default ~/.cache/curdler), keyed by a hash of the list
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'curdler')
+
+# Precomputed gains of the hard-coded starting words for the bundled
+# wordles.txt; only used while the loaded list still hashes to this key
+BUNDLED_WORD_LIST_KEY = "bfc2e3e66a3f324017ac51da70d0bdcf"
+BUNDLED_STARTING_GAINS = {"RAISE": 5.880903584974946, "CANOE": 5.507862828599184}
+
+# Word lists longer than this score guesses on the fly rather than through an
+# N x N feedback matrix (8192 words is a 64 MB matrix)
+MAX_MATRIX_WORDS = 8192
+
+# Scoring results each solver remembers, most recently used first to survive
+MEMO_SIZE = 1024
+
+# Candidates scored between checks against the entropy upper bound in _search_best_guess
+PRUNE_BLOCK_SIZE = 256
 
 # Color codes for terminal output
 class Colors:
@@ -24,134 +63,490 @@ class Colors:
     UNDERLINE = '\033[4m'
     END = '\033[0m'
 
+def encode_feedback(feedback: List[str]) -> int:
+    """Pack a list of G/Y/X marks into a feedback code."""
+    code = 0
+    for mark in feedback:
+        code = code * 3 + FEEDBACK_MARKS.index(mark)
+    return code
+
+def decode_feedback(code: int) -> List[str]:
+    """Unpack a feedback code into a list of G/Y/X marks."""
+    return [FEEDBACK_MARKS[(code // 3 ** (4 - i)) % 3] for i in range(5)]
+
+def word_list_key(words: List[str]) -> str:
+    """Hash a word list so cached results can be matched to it."""
+    return hashlib.blake2b('\n'.join(words).encode('ascii'), digest_size=16).hexdigest()
+
+def _cache_path(name: str, words: List[str], extension: str) -> str:
+    """Path of a cache file for this word list."""
+    return os.path.join(CACHE_DIR, f"{name}_{word_list_key(words)}.{extension}")
+
+def _write_cache_file(path: str, write):
+    """Write a cache file atomically so concurrent readers never see a partial file."""
+    temp_name = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as f:
+            temp_name = f.name
+            write(f)
+        os.replace(temp_name, path)
+    except OSError:
+        # Caching is best effort, but don't leave a partial temporary file behind
+        if temp_name is not None:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+
+def load_starting_cache(words: List[str]) -> Dict[str, float]:
+    """Load cached starting-word information gains computed for this word list."""
+    try:
+        with open(_cache_path('first_guess', words, 'pkl'), 'rb') as f:
+            cache = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_starting_cache(words: List[str], information_gain: Dict[str, float]):
+    """Save starting-word information gains for this word list."""
+    _write_cache_file(_cache_path('first_guess', words, 'pkl'),
+                      lambda f: pickle.dump(information_gain, f))
+
+def words_to_array(words: List[str]) -> np.ndarray:
+    """Convert words into an (N, 5) uint8 array of letter codes (A=0 ... Z=25)."""
+    letters = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)
+    return letters.reshape(len(words), 5) - ord('A')
+
+def letter_masks(word_array: np.ndarray) -> np.ndarray:
+    """Compute each word's letter set as a uint32 bitmask (bit c set if letter c occurs)."""
+    return np.bitwise_or.reduce(np.uint32(1) << word_array.astype(np.uint32), axis=1)
+
+def letter_counts(word_array: np.ndarray) -> np.ndarray:
+    """Count each letter in each word, as an (N, 26) uint8 array."""
+    counts = np.zeros((len(word_array), 26), dtype=np.uint8)
+    np.add.at(counts, (np.arange(len(word_array))[:, None], word_array), 1)
+    return counts
+
+@lru_cache(maxsize=None)
+def feedback_letter_masks(guess: str, feedback: int) -> Tuple[int, int]:
+    """Bitmasks of the letters a word compatible with the feedback must lack and must contain.
+
+    Letters marked gray and not green or yellow elsewhere in the guess must
+    be absent; letters marked green or yellow must be present.
+    """
+    gray = 0
+    marked = 0
+    for i, letter in enumerate(guess):
+        bit = 1 << (ord(letter) - ord('A'))
+        if (feedback // 3 ** (4 - i)) % 3 == GRAY:
+            gray |= bit
+        else:
+            marked |= bit
+    return gray & ~marked, marked
+
+def get_feedback_batch(guess: np.ndarray, solutions: np.ndarray) -> np.ndarray:
+    """Compute packed feedback codes of one guess against many solutions.
+
+    guess is a uint8[5] letter array and solutions a uint8[N, 5] array; the
+    per-position loops run over whole columns so only five NumPy steps are
+    needed regardless of N.
+    """
+    greens = solutions == guess
+    rows = np.arange(len(solutions))
+    
+    # Count the solution letters not matched by a green, per solution
+    remaining = np.zeros((len(solutions), 26), dtype=np.int8)
+    for k in range(5):
+        remaining[rows, solutions[:, k]] += ~greens[:, k]
+    
+    # Assign yellows left to right while unmatched copies of the letter remain
+    codes = np.zeros(len(solutions), dtype=np.uint8)
+    for k in range(5):
+        yellows = ~greens[:, k] & (remaining[:, guess[k]] > 0)
+        remaining[:, guess[k]] -= yellows
+        codes = codes * 3 + np.where(greens[:, k], 2, yellows).astype(np.uint8)
+    
+    return codes
+
+def entropy_upper_bound(n_solutions: int) -> float:
+    """Largest information gain any guess can have against n_solutions solutions."""
+    return math.log2(min(n_solutions, NUM_FEEDBACK_CODES)) if n_solutions > 0 else 0.0
+
+def heuristic_order(candidates: np.ndarray, solutions: np.ndarray) -> np.ndarray:
+    """Order candidates by how often their letters occur at the same position in the solutions.
+
+    Candidates that share many positional letters with the remaining
+    solutions tend to split them well, so scoring them first lets the
+    best-guess search reach the entropy upper bound sooner.
+    """
+    frequency = np.zeros((5, 26), dtype=np.int32)
+    for k in range(5):
+        frequency[k] = np.bincount(solutions[:, k], minlength=26)
+    scores = frequency[np.arange(5), candidates].sum(axis=1)
+    return np.argsort(-scores, kind='stable')
+
+def _as_letters(word_array: np.ndarray) -> np.ndarray:
+    """Letter array in the contiguous uint8 layout the compiled kernels expect.
+
+    The ahead-of-time kernels reinterpret their arguments without checking
+    dtypes, so every kernel call goes through this and _as_indices.
+    """
+    return np.ascontiguousarray(word_array, dtype=np.uint8)
+
+def _as_indices(indices: np.ndarray) -> np.ndarray:
+    """Index array in the contiguous int32 layout the compiled kernels expect."""
+    return np.ascontiguousarray(indices, dtype=np.int32)
+
+def compute_feedback_matrix(guesses: np.ndarray, solutions: np.ndarray) -> np.ndarray:
+    """Compute the packed feedback code of every guess against every solution.
+
+    Returns a (len(guesses), len(solutions)) uint8 matrix using the same
+    two-pass green/yellow algorithm as WordleSolver._get_feedback.
+    """
+    if KERNELS_AVAILABLE:
+        return feedback_matrix_kernel(_as_letters(guesses), _as_letters(solutions))
+    
+    matrix = np.empty((len(guesses), len(solutions)), dtype=np.uint8)
+    for i, guess in enumerate(guesses):
+        matrix[i] = get_feedback_batch(guess, solutions)
+    return matrix
+
+def feedback_histogram(feedback_codes: np.ndarray) -> np.ndarray:
+    """Count how often each of the 243 feedback codes occurs."""
+    return np.bincount(feedback_codes, minlength=NUM_FEEDBACK_CODES).astype(np.int32)
+
+def feedback_entropies(feedback_codes: np.ndarray) -> np.ndarray:
+    """Shannon entropy in bits of each row of a (C, S) array of feedback codes.
+
+    Rows are histogrammed together with one np.bincount by offsetting each
+    row into its own block of 243 bins. Rows are processed in blocks to
+    bound the size of the temporary arrays.
+    """
+    n_rows, n_cols = feedback_codes.shape
+    entropies = np.zeros(n_rows, dtype=np.float64)
+    if n_cols == 0:
+        return entropies
+    
+    block_rows = max(1, (1 << 20) // n_cols)
+    for start in range(0, n_rows, block_rows):
+        block = feedback_codes[start:start + block_rows]
+        offsets = np.arange(len(block))[:, None] * NUM_FEEDBACK_CODES
+        counts = np.bincount((block + offsets).ravel(), minlength=len(block) * NUM_FEEDBACK_CODES)
+        counts = counts.reshape(len(block), NUM_FEEDBACK_CODES)
+        weighted = (counts * np.log2(np.maximum(counts, 1))).sum(axis=1)
+        entropies[start:start + len(block)] = math.log2(n_cols) - weighted / n_cols
+    
+    return entropies
+
+def score_candidates(feedback_matrix: np.ndarray, candidate_indices: np.ndarray,
+                     solution_indices: np.ndarray) -> np.ndarray:
+    """Information gain of each candidate row of the feedback matrix against the solution columns."""
+    if KERNELS_AVAILABLE:
+        scores = np.empty(len(candidate_indices), dtype=np.float64)
+        score_all_kernel(np.ascontiguousarray(feedback_matrix, dtype=np.uint8),
+                         _as_indices(candidate_indices), _as_indices(solution_indices), scores)
+        return scores
+    return feedback_entropies(feedback_matrix[np.ix_(candidate_indices, solution_indices)])
+
+def score_candidates_inline(word_array: np.ndarray, candidate_indices: np.ndarray,
+                            solution_indices: np.ndarray) -> np.ndarray:
+    """Like score_candidates, but computing feedback from the letter array instead of a matrix.
+
+    Only the (N, 5) word array needs to be resident, at the cost of
+    recomputing each feedback code.
+    """
+    if KERNELS_AVAILABLE:
+        scores = np.empty(len(candidate_indices), dtype=np.float64)
+        score_inline_kernel(_as_letters(word_array), _as_indices(candidate_indices),
+                            _as_indices(solution_indices), scores)
+        return scores
+    return feedback_entropies(compute_feedback_matrix(word_array[candidate_indices], word_array[solution_indices]))
+
+def feedback_entropy(counts: np.ndarray) -> float:
+    """Shannon entropy in bits of a histogram of feedback codes."""
+    total = int(counts.sum())
+    if total == 0:
+        return 0.0
+    repeated = counts[counts > 1].astype(np.float64)
+    return math.log2(total) - float((repeated * np.log2(repeated)).sum()) / total
+
+@lru_cache(maxsize=4)
+def _load_words_cached(filename: str) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Load words and their letter array from file, once per file per process."""
+    words = []
+    with open(filename, 'r') as f:
+        for line_number, line in enumerate(f, 1):
+            word = line.strip().upper()
+            if not word:
+                continue
+            # The kernels index letter tables by code without bounds checks
+            if not _WORD_RE.fullmatch(word):
+                raise ValueError(f"{filename}:{line_number}: {word!r} is not a 5-letter word (A-Z only)")
+            words.append(word)
+    words = tuple(words)
+    
+    word_array = words_to_array(list(words))
+    word_array.flags.writeable = False  # Shared by every solver using this file
+    return words, word_array
+
+@lru_cache(maxsize=4)
+def _feedback_matrix_cached(filename: str) -> np.ndarray:
+    """Feedback matrix of a word list against itself, once per file per process.
+
+    The matrix is also cached on disk; later runs memory-map it read-only, so
+    rows are paged in on demand and shared through the page cache.
+    """
+    words, word_array = _load_words_cached(filename)
+    path = _cache_path('patterns', words, 'npy')
+    try:
+        matrix = np.load(path, mmap_mode='r')
+        if matrix.shape != (len(words), len(words)) or matrix.dtype != np.uint8:
+            raise ValueError("stale feedback matrix cache")
+    except (OSError, ValueError):
+        matrix = compute_feedback_matrix(word_array, word_array)
+        _write_cache_file(path, lambda f: np.save(f, matrix))
+    
+    matrix.flags.writeable = False
+    return matrix
+
 class WordleSolver:
     def __init__(self, word_list_file: str = "wordles.txt", hard_mode: bool = False):
         """Initialize the solver with a word list."""
+        self.word_list_file = word_list_file
         self.words = self._load_words(word_list_file)
-        self.possible_solutions = self.words.copy()
+        self.word_array = _load_words_cached(word_list_file)[1]
+        self.word_index = {word: i for i, word in enumerate(self.words)}
+        self.use_feedback_matrix = len(self.words) <= MAX_MATRIX_WORDS
+        self.sol_idx = np.arange(len(self.words), dtype=np.int32)  # Indices of possible solutions
         self.guess_history = []
+        self.hard_mask = np.ones(len(self.words), dtype=bool)  # Words consistent with every guess so far
         self.hard_mode = hard_mode
         self.step_count = 0
+        self._score_memo = OrderedDict()  # Bounded LRU of scoring results, see _memoized
         
     def _load_words(self, filename: str) -> List[str]:
         """Load words from file."""
-        with open(filename, 'r') as f:
-            return [line.strip().upper() for line in f if line.strip()]
+        return list(_load_words_cached(filename)[0])
     
-    def _get_feedback(self, guess: str, solution: str) -> List[str]:
-        """Get feedback for a guess against a solution."""
-        feedback = [''] * 5
-        solution_letters = list(solution)
-        
-        # First pass: mark greens
-        for i in range(5):
-            if guess[i] == solution[i]:
-                feedback[i] = 'G'
-                solution_letters[i] = None
+    @property
+    def feedback_matrix(self) -> np.ndarray:
+        """Feedback code of every word (row) against every word (column), built on first use."""
+        return _feedback_matrix_cached(self.word_list_file)
+    
+    @cached_property
+    def letter_masks(self) -> np.ndarray:
+        """Letter-set bitmask of every word, built on first use by _is_word_compatible."""
+        return letter_masks(self.word_array)
+    
+    @cached_property
+    def word_counts_arr(self) -> np.ndarray:
+        """(N, 26) letter counts of every word, built on first use by _is_word_compatible."""
+        return letter_counts(self.word_array)
+    
+    @property
+    def possible_solutions(self) -> List[str]:
+        """Words still compatible with all feedback so far."""
+        return [self.words[i] for i in self.sol_idx]
+    
+    def _get_feedback(self, guess: str, solution: str) -> int:
+        """Get the packed feedback code for a guess against a solution."""
+        # First pass: count solution letters not matched by a green
+        remaining = [0] * 26
+        for g, s in zip(guess, solution):
+            if g != s:
+                remaining[ord(s) - 65] += 1
         
-        # Second pass: mark yellows and grays
-        for i in range(5):
-            if feedback[i] == '':  # Not green
-                if guess[i] in solution_letters:
-                    feedback[i] = 'Y'
-                    # Remove the first occurrence of this letter
-                    solution_letters[solution_letters.index(guess[i])] = None
-                else:
-                    feedback[i] = 'X'
+        # Second pass: greens, then yellows left to right while letters remain
+        code = 0
+        for g, s in zip(guess, solution):
+            if g == s:
+                code = code * 3 + GREEN
+            elif remaining[ord(g) - 65]:
+                remaining[ord(g) - 65] -= 1
+                code = code * 3 + YELLOW
+            else:
+                code = code * 3 + GRAY
         
-        return feedback
+        return code
     
-    def _is_word_compatible(self, word: str, guess: str, feedback: List[str]) -> bool:
-        """Check if a word is compatible with the given guess and feedback."""
-        word_letters = list(word)
-        guess_letters = list(guess)
+    def _is_word_compatible(self, word: str, guess: str, feedback: int) -> bool:
+        """Check if a word is compatible with the given guess and feedback code."""
+        # Reject words containing a gray-only letter or missing a green or yellow
+        # one with two bitmask tests
+        index = self.word_index.get(word)
+        if index is not None:
+            word_mask = int(self.letter_masks[index])
+        else:
+            word_mask = sum(1 << (ord(letter) - ord('A')) for letter in set(word))
+        excluded, required = feedback_letter_masks(guess, feedback)
+        if word_mask & excluded or required & ~word_mask:
+            return False
+        
+        # Positional checks for greens, yellows and repeated letters, consuming
+        # letters from the word's remaining counts
+        if index is not None:
+            counts = bytearray(self.word_counts_arr[index].tobytes())
+        else:
+            counts = bytearray(26)
+            for letter in word:
+                counts[ord(letter) - 65] += 1
+        marks = [(feedback // 3 ** (4 - i)) % 3 for i in range(5)]
         
         # Check greens first
         for i in range(5):
-            if feedback[i] == 'G':
+            if marks[i] == GREEN:
                 if word[i] != guess[i]:
                     return False
-                word_letters[i] = None
-                guess_letters[i] = None
+                counts[ord(word[i]) - 65] -= 1
         
         # Check yellows and grays
         for i in range(5):
-            if feedback[i] == 'Y':
+            letter = ord(guess[i]) - 65
+            if marks[i] == YELLOW:
                 # Letter must be in word but not at this position
-                if guess[i] not in word_letters or word[i] == guess[i]:
+                if not counts[letter] or word[i] == guess[i]:
                     return False
-                # Remove the first occurrence of this letter
-                if guess[i] in word_letters:
-                    word_letters[word_letters.index(guess[i])] = None
-            elif feedback[i] == 'X':
+                counts[letter] -= 1
+            elif marks[i] == GRAY:
                 # Letter must not be in word
-                if guess[i] in word_letters:
+                if counts[letter]:
                     return False
         
         return True
     
+    def _feedback_row(self, guess: str) -> np.ndarray:
+        """Feedback codes of a guess against every word in the list."""
+        index = self.word_index.get(guess)
+        if index is None:
+            return get_feedback_batch(words_to_array([guess])[0], self.word_array)
+        if self.use_feedback_matrix:
+            return self.feedback_matrix[index]
+        return get_feedback_batch(self.word_array[index], self.word_array)
+    
     def _is_hard_mode_compatible(self, word: str) -> bool:
         """Check if a word satisfies hard mode constraints."""
         if not self.hard_mode or not self.guess_history:
             return True
         
+        index = self.word_index.get(word)
+        if index is not None:
+            return bool(self.hard_mask[index])
+        
+        # Same exact-feedback test as the mask, so listed and unlisted words agree
         for guess, feedback in self.guess_history:
-            if not self._is_word_compatible(word, guess, feedback):
+            if self._get_feedback(guess, word) != feedback:
                 return False
         
         return True
     
-    def _filter_solutions(self, guess: str, feedback: List[str]) -> List[str]:
-        """Filter possible solutions based on guess and feedback."""
-        return [word for word in self.possible_solutions 
-                if self._is_word_compatible(word, guess, feedback)]
+    def _filter_solutions(self, guess: str, feedback: int, row: Optional[np.ndarray] = None):
+        """Filter possible solutions based on guess and feedback.
+
+        row is the guess's feedback row if the caller already has it.
+        """
+        if row is None:
+            row = self._feedback_row(guess)
+        self.sol_idx = self.sol_idx[row[self.sol_idx] == feedback]
+    
+    def _word_indices(self, words: List[str]) -> Optional[np.ndarray]:
+        """Indices of words in the word list, or None if any of them is not in it."""
+        indices = [self.word_index.get(word) for word in words]
+        if None in indices:
+            return None
+        return np.array(indices, dtype=np.intp)
+    
+    def _feedback_histogram(self, guess: str, possible_solutions: List[str], guess_index: Optional[int],
+                            solution_indices: Optional[np.ndarray]) -> np.ndarray:
+        """Count how many solutions would remain for each possible feedback.
+
+        guess_index and solution_indices are the words' list indices, or None
+        for words outside the list.
+        """
+        # Words from the list read their feedback straight out of the matrix
+        if self.use_feedback_matrix and guess_index is not None and solution_indices is not None:
+            return feedback_histogram(self.feedback_matrix[guess_index, solution_indices])
+        
+        guess_array = words_to_array([guess])[0]
+        solution_array = words_to_array(possible_solutions)
+        if KERNELS_AVAILABLE:
+            return feedback_histogram_kernel(_as_letters(guess_array), _as_letters(solution_array))
+        return feedback_histogram(get_feedback_batch(guess_array, solution_array))
+    
+    def _memoized(self, key: tuple, compute):
+        """Return compute() for key, remembering the last MEMO_SIZE results."""
+        if key in self._score_memo:
+            self._score_memo.move_to_end(key)
+            return self._score_memo[key]
+        
+        result = compute()
+        self._score_memo[key] = result
+        if len(self._score_memo) > MEMO_SIZE:
+            self._score_memo.popitem(last=False)
+        return result
     
     def _calculate_information_gain(self, guess: str, possible_solutions: List[str]) -> float:
         """Calculate the expected information gain of a guess."""
         if not possible_solutions:
             return 0.0
         
-        # Count how many solutions would remain for each possible feedback
-        feedback_counts = Counter()
-        
-        for solution in possible_solutions:
-            feedback = self._get_feedback(guess, solution)
-            feedback_str = ''.join(feedback)
-            feedback_counts[feedback_str] += 1
-        
-        # Calculate entropy reduction
-        total_solutions = len(possible_solutions)
-        information_gain = 0.0
-        
-        for count in feedback_counts.values():
-            if count > 0:
-                probability = count / total_solutions
-                information_gain -= probability * math.log2(probability)
-        
-        return information_gain
+        # Calculate entropy reduction, reusing earlier results for the same listed words
+        guess_index = self.word_index.get(guess)
+        solution_indices = self._word_indices(possible_solutions)
+        compute = lambda: feedback_entropy(
+            self._feedback_histogram(guess, possible_solutions, guess_index, solution_indices))
+        if guess_index is None or solution_indices is None:
+            return compute()
+        return self._memoized(('gain', guess_index, solution_indices.tobytes()), compute)
     
-    def _get_best_guess(self, possible_solutions: List[str], allow_solutions: bool = True) -> Tuple[str, float]:
-        """Find the word that provides the most information."""
-        best_guess = None
-        best_information = -1
-        
+    def _get_best_guess(self, sol_idx: np.ndarray, allow_solutions: bool = True) -> Tuple[str, float]:
+        """Find the word that provides the most information against the solutions at sol_idx."""
         # In hard mode, we can only use words that satisfy hard mode constraints
         if self.hard_mode:
-            candidate_words = [w for w in possible_solutions if self._is_hard_mode_compatible(w)]
-            if not candidate_words:
+            candidate_indices = sol_idx[self.hard_mask[sol_idx]]
+            if not len(candidate_indices):
                 # If no solutions satisfy hard mode, we have to use any compatible word
-                candidate_words = [w for w in self.words if self._is_hard_mode_compatible(w)]
-        else:
+                candidate_indices = np.flatnonzero(self.hard_mask).astype(np.int32)
+        elif allow_solutions:
             # Consider all words as potential guesses
-            candidate_words = self.words if allow_solutions else [w for w in self.words if w not in possible_solutions]
+            candidate_indices = np.arange(len(self.words), dtype=np.int32)
+        else:
+            allowed = np.ones(len(self.words), dtype=bool)
+            allowed[sol_idx] = False
+            candidate_indices = np.flatnonzero(allowed).astype(np.int32)
         
-        for guess in candidate_words:
-            information = self._calculate_information_gain(guess, possible_solutions)
-            if information > best_information:
-                best_information = information
-                best_guess = guess
+        if not len(candidate_indices):
+            return None, -1
         
-        return best_guess, best_information
+        # A position seen before has the same best guess. Outside hard mode the
+        # candidates follow from allow_solutions and the solutions alone
+        key = ('best', self.hard_mode, allow_solutions, sol_idx.astype(np.int32).tobytes())
+        if self.hard_mode:
+            key += (candidate_indices.tobytes(),)
+        return self._memoized(key, lambda: self._search_best_guess(candidate_indices, sol_idx))
+    
+    def _search_best_guess(self, candidate_indices: np.ndarray, sol_idx: np.ndarray) -> Tuple[str, float]:
+        """Find the candidate that provides the most information against the solutions at sol_idx."""
+        # Score blocks of candidates in heuristic order, and stop once one reaches
+        # the upper bound
+        order = heuristic_order(self.word_array[candidate_indices], self.word_array[sol_idx])
+        upper_bound = entropy_upper_bound(len(sol_idx))
+        best_index = None
+        best_information = -1
+        for start in range(0, len(order), PRUNE_BLOCK_SIZE):
+            block = np.sort(order[start:start + PRUNE_BLOCK_SIZE])
+            if self.use_feedback_matrix:
+                scores = score_candidates(self.feedback_matrix, candidate_indices[block], sol_idx)
+            else:
+                scores = score_candidates_inline(self.word_array, candidate_indices[block], sol_idx)
+            index = int(block[scores.argmax()])
+            information = float(scores.max())
+            if information > best_information or (information == best_information and index < best_index):
+                best_index, best_information = index, information
+            if best_information >= upper_bound - 1e-9:
+                break
+        
+        return self.words[candidate_indices[best_index]], best_information
     
     def get_initial_guess(self) -> Tuple[str, float]:
         """Get the best starting word."""
@@ -163,21 +558,36 @@ class WordleSolver:
             # RAISE is optimal for normal mode
             initial_word = "RAISE"
         
+        # The gain only depends on the word list, so reuse it across sessions
+        if initial_word in BUNDLED_STARTING_GAINS and word_list_key(self.words) == BUNDLED_WORD_LIST_KEY:
+            return initial_word, BUNDLED_STARTING_GAINS[initial_word]
+        
+        cached = load_starting_cache(self.words)
+        if initial_word in cached:
+            return initial_word, cached[initial_word]
+        
         # Calculate information gain for the hard-coded word
         information_gain = self._calculate_information_gain(initial_word, self.words)
+        cached[initial_word] = information_gain
+        save_starting_cache(self.words, cached)
         return initial_word, information_gain
     
-    def process_feedback(self, guess: str, feedback: List[str]) -> Tuple[str, float]:
-        """Process feedback and return the best next guess."""
+    def process_feedback(self, guess: str, feedback: int) -> Tuple[str, float]:
+        """Process a feedback code and return the best next guess."""
         # Add to history
         self.guess_history.append((guess, feedback))
         self.step_count += 1
         
+        # Narrow hard-mode candidates by the new constraint only
+        row = self._feedback_row(guess)
+        if self.hard_mode:
+            self.hard_mask &= row == feedback
+        
         # Filter possible solutions
-        self.possible_solutions = self._filter_solutions(guess, feedback)
+        self._filter_solutions(guess, feedback, row)
         
         # Calculate statistics
-        total_solutions = len(self.possible_solutions)
+        total_solutions = len(self.sol_idx)
         percentage_remaining = (total_solutions / len(self.words)) * 100
         
         print(f"\n{Colors.CYAN}📊 Statistics:{Colors.END}")
@@ -189,37 +599,32 @@ class WordleSolver:
         
         # If we have one solution left, suggest it
         if total_solutions == 1:
-            return self.possible_solutions[0], 0.0
+            return self.words[self.sol_idx[0]], 0.0
         
         # Get best next guess
-        return self._get_best_guess(self.possible_solutions)
+        return self._get_best_guess(self.sol_idx)
     
     def reset(self):
         """Reset the solver for a new puzzle."""
-        self.possible_solutions = self.words.copy()
+        self.sol_idx = np.arange(len(self.words), dtype=np.int32)
         self.guess_history = []
+        self.hard_mask = np.ones(len(self.words), dtype=bool)
         self.step_count = 0
 
-def parse_feedback(feedback_str: str) -> List[str]:
-    """Parse feedback string into list of feedback codes."""
-    feedback_map = {'g': 'G', 'y': 'Y', 'x': 'X', 'G': 'G', 'Y': 'Y', 'X': 'X'}
-    feedback = []
-    
-    for char in feedback_str.upper():
-        if char in feedback_map:
-            feedback.append(feedback_map[char])
-        else:
-            raise ValueError(f"Invalid feedback character: {char}")
-    
-    if len(feedback) != 5:
-        raise ValueError(f"Feedback must be exactly 5 characters, got {len(feedback)}")
+def parse_feedback(feedback_str: str) -> int:
+    """Parse feedback string into a packed feedback code."""
+    if not _FB_RE.fullmatch(feedback_str):
+        for char in feedback_str.upper():
+            if char not in FEEDBACK_MARKS:
+                raise ValueError(f"Invalid feedback character: {char}")
+        raise ValueError(f"Feedback must be exactly 5 characters, got {len(feedback_str)}")
     
-    return feedback
+    return int(feedback_str.translate(_FB_DIGITS), 3)
 
-def display_feedback_colored(feedback: List[str]) -> str:
-    """Display feedback with colored squares."""
+def display_feedback_colored(feedback: int) -> str:
+    """Display a feedback code with colored squares."""
     colored = ""
-    for f in feedback:
+    for f in decode_feedback(feedback):
         if f == 'G':
             colored += f"{Colors.GREEN}🟩{Colors.END}"
         elif f == 'Y':
@@ -274,7 +679,7 @@ def main():
                 continue
         
         # Check if we solved it
-        if all(f == 'G' for f in feedback):
+        if feedback == ALL_GREEN:
             print(f"{Colors.GREEN}🎉 Congratulations! Puzzle solved in {solver.step_count + 1} steps!{Colors.END}")
             return
         
@@ -282,7 +687,7 @@ def main():
         next_guess, next_info = solver.process_feedback(initial_guess, feedback)
         
         # Check if we have only one solution left
-        if len(solver.possible_solutions) == 1:
+        if len(solver.sol_idx) == 1:
             print(f"\n{Colors.YELLOW}🎯 Only one solution remaining: {Colors.BOLD}{next_guess}{Colors.END}")
             print(f"{Colors.WHITE}Is this the correct solution? (yes/no): {Colors.END}", end="")
             response = input().strip().lower()